@@ -0,0 +1,215 @@
+# audio_filters.py
+# DSP kernels shared by make_witcher_sfx.py and make_witcher_sfx_v2.py.
+# The per-sample recurrences run as ahead-of-time compiled kernels when
+# compile_kernels.py has been run (sfx_kernels extension, float32 buffers), as numba
+# @njit kernels when numba is installed, through scipy.signal.lfilter when only
+# SciPy is, and as plain Python otherwise.
+
+import functools
+import hashlib
+import inspect
+import math
+from typing import Optional
+
+import numpy as np
+
+try:
+    import numba
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # numba is optional: kernels then run as plain Python
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+
+        return wrap
+
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # scipy is optional too (see one_pole_lp/one_pole_hp)
+    lfilter = None
+
+try:  # built by compile_kernels.py; no JIT warmup on import
+    import sfx_kernels
+except ImportError:
+    sfx_kernels = None
+
+
+# ----------------------------
+# Kernels
+# ----------------------------
+@njit(cache=True, fastmath=True)
+def _lp_kernel(x, alpha, y):
+    y[0] = x[0]
+    for i in range(1, x.shape[0]):
+        y[i] = y[i - 1] + alpha * (x[i] - y[i - 1])
+
+
+@njit(cache=True, fastmath=True)
+def _hp_kernel(x, alpha, y):
+    # x[i - 1] is carried in a local so y may alias x (in-place filtering)
+    prev = x[0]
+    y[0] = prev
+    for i in range(1, x.shape[0]):
+        xi = x[i]
+        y[i] = alpha * (y[i - 1] + xi - prev)
+        prev = xi
+
+
+@njit(cache=True, fastmath=True)
+def _comb_kernel(y, d, fb):
+    for i in range(d, y.shape[0]):
+        y[i] += fb * y[i - d]
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _reverb_kernel(st, y, delays, gL, gR):
+    # Each sample only reads st (never written here) and writes its own y row,
+    # so the sample loop splits across threads without races
+    for i in prange(st.shape[0]):
+        sL = y[i, 0]
+        sR = y[i, 1]
+        for k in range(delays.shape[0]):
+            d = delays[k]
+            if i >= d:
+                sL += gL[k] * st[i - d, 0]
+                sR += gR[k] * st[i - d, 1]
+        y[i, 0] = sL
+        y[i, 1] = sR
+
+
+_JIT_KERNELS = {
+    "lp": _lp_kernel,
+    "hp": _hp_kernel,
+    "comb": _comb_kernel,
+    "reverb": _reverb_kernel,
+}
+
+
+def kernel_source_hash() -> int:
+    # Digest of the kernel sources; compile_kernels.py bakes it into sfx_kernels
+    digest = hashlib.sha1()
+    for kernel in _JIT_KERNELS.values():
+        digest.update(inspect.getsource(getattr(kernel, "py_func", kernel)).encode())
+    return int(digest.hexdigest()[:15], 16)  # fits the AOT export's int64
+
+
+# A build from older kernel sources would silently run stale code: ignore it
+if sfx_kernels is not None and (
+    not hasattr(sfx_kernels, "source_hash")
+    or sfx_kernels.source_hash() != kernel_source_hash()
+):
+    sfx_kernels = None
+
+
+def kernel_backend() -> str:
+    # Which build runs the kernels: their results differ in the last float bits
+    if sfx_kernels is not None:
+        return "aot"
+    if HAS_NUMBA:
+        return "jit"
+    return "lfilter" if lfilter is not None else "python"
+
+
+def _compiled_kernel(name: str, *arrays: Optional[np.ndarray]):
+    # AOT build first (it only has float32 signatures), then the numba JIT
+    aot = getattr(sfx_kernels, f"{name}_kernel", None)
+    if aot is not None and all(a.dtype == np.float32 for a in arrays if a is not None):
+        return aot
+    if HAS_NUMBA:
+        return _JIT_KERNELS[name]
+    return None
+
+
+def set_kernel_threads(n: int):
+    # Threads used by the parallel JIT kernels (numba's default is every core).
+    # The AOT reverb is serial, and it always wins when built, so the output
+    # never depends on the core count.
+    if HAS_NUMBA:
+        numba.set_num_threads(max(1, min(n, numba.config.NUMBA_NUM_THREADS)))
+
+
+# ----------------------------
+# Filters
+# ----------------------------
+@functools.lru_cache(maxsize=32)
+def one_pole_coeffs(
+    cutoff_hz: float, sr: int, kind: str
+) -> tuple[float, tuple, tuple]:
+    # (alpha, b, a) of the 1-pole filters; the same few cutoffs recur across SFX
+    rc = 1.0 / (2 * math.pi * cutoff_hz)
+    dt = 1.0 / sr
+    if kind == "low":
+        alpha = dt / (rc + dt)
+        return alpha, (alpha,), (1.0, alpha - 1.0)
+    alpha = rc / (rc + dt)
+    return alpha, (alpha, -alpha), (1.0, -alpha)
+
+
+def _lfilter_primed(
+    b: tuple, a: tuple, alpha: float, x: np.ndarray, out: Optional[np.ndarray]
+) -> np.ndarray:
+    # SciPy's C loop runs the recurrence; zi primes the state so y[0] == x[0]
+    y, _ = lfilter(b, a, x, zi=[(1.0 - alpha) * x[0]])
+    y = y.astype(x.dtype, copy=False)
+    if out is None:
+        return y
+    out[:] = y
+    return out
+
+
+def one_pole_lp(
+    x: np.ndarray, cutoff_hz: float, sr: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    # Simple 1-pole low-pass (real-time friendly; musical, not surgical)
+    alpha, b, a = one_pole_coeffs(cutoff_hz, sr, "low")
+    kernel = _compiled_kernel("lp", x, out)
+    if kernel is None and lfilter is not None:
+        return _lfilter_primed(b, a, alpha, x, out)
+    y = np.empty_like(x) if out is None else out
+    (kernel or _lp_kernel)(x, alpha, y)
+    return y
+
+
+def one_pole_hp(
+    x: np.ndarray, cutoff_hz: float, sr: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    # Simple 1-pole high-pass
+    alpha, b, a = one_pole_coeffs(cutoff_hz, sr, "high")
+    kernel = _compiled_kernel("hp", x, out)
+    if kernel is None and lfilter is not None:
+        return _lfilter_primed(b, a, alpha, x, out)
+    y = np.empty_like(x) if out is None else out
+    (kernel or _hp_kernel)(x, alpha, y)
+    return y
+
+
+def comb_inplace(y: np.ndarray, delay_samples: int, feedback: float):
+    # Feedback comb: y[i] += feedback * y[i - delay], in place
+    kernel = _compiled_kernel("comb", y) or _comb_kernel
+    kernel(y, delay_samples, feedback)
+
+
+def reverb_taps_inplace(
+    st: np.ndarray,
+    y: np.ndarray,
+    delays: np.ndarray,
+    gains_l: np.ndarray,
+    gains_r: np.ndarray,
+):
+    # Adds every delayed, scaled tap of stereo st into y
+    kernel = _compiled_kernel("reverb", st, y)
+    if kernel is not None:
+        kernel(st, y, delays, gains_l, gains_r)
+        return
+    # Without numba the kernel would loop in Python: accumulate whole taps instead
+    n = len(st)
+    for d, g_l, g_r in zip(delays, gains_l, gains_r):
+        if d < n:
+            y[d:, 0] += g_l * st[: n - d, 0]
+            y[d:, 1] += g_r * st[: n - d, 1]
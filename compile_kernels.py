@@ -0,0 +1,50 @@
+# compile_kernels.py
+# Builds the audio_filters.py kernels ahead of time into the sfx_kernels extension
+# (.so/.pyd next to this file), so the SFX scripts skip numba's JIT warmup.
+# Requirements:
+#   pip install numpy numba
+# Usage: python compile_kernels.py. Re-run it after editing the kernels in
+# audio_filters.py; until then the stale build is ignored.
+# The build is machine-specific and git-ignored; audio_filters.py falls back to the
+# JIT (or SciPy/NumPy) when it is missing.
+
+import os
+
+from numba.pycc import CC
+
+import audio_filters
+
+# Signatures match the scripts' buffers: float32 samples, float64 coefficients,
+# int64 delays. Other dtypes keep going through the JIT kernels. pycc builds the
+# reverb's prange loop serially; the threaded JIT only runs without this build.
+KERNELS = {
+    "lp_kernel": (audio_filters._lp_kernel, "void(f4[:], f8, f4[:])"),
+    "hp_kernel": (audio_filters._hp_kernel, "void(f4[:], f8, f4[:])"),
+    "comb_kernel": (audio_filters._comb_kernel, "void(f4[:], i8, f8)"),
+    "reverb_kernel": (
+        audio_filters._reverb_kernel,
+        "void(f4[:, :], f4[:, :], i8[:], f8[:], f8[:])",
+    ),
+}
+
+
+def main():
+    cc = CC("sfx_kernels")
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    for name, (kernel, signature) in KERNELS.items():
+        # Export the plain Python source of the @njit dispatcher
+        cc.export(name, signature)(kernel.py_func)
+
+    # audio_filters.py ignores the build once the kernel sources change
+    digest = audio_filters.kernel_source_hash()
+
+    def source_hash():
+        return digest
+
+    cc.export("source_hash", "i8()")(source_hash)
+    cc.compile()
+    print(f"\n✅ Kernels compiled into {cc.output_dir} (sfx_kernels)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,39 @@
 # make_witcher_sfx.py
 # Generates Witcher-style SFX as MP3 (320 kbps), saves into ./public/assets/sfx and zips them.
 # Requirements:
-#   pip install numpy pydub
-# Also requires ffmpeg installed and on PATH to export MP3 with pydub.
+#   pip install numpy
+# Optional: pip install numba (JIT-compiles the per-sample filter loops),
+# or pip install scipy (runs the 1-pole filters through lfilter when numba is absent).
+# Filters/reverb kernels live in audio_filters.py, which must sit next to this script.
+# With numba, `python compile_kernels.py` prebuilds them once (no JIT warmup per run).
+# Also requires ffmpeg installed and on PATH to export MP3 (PCM is piped straight into it).
 # If ffmpeg is missing, the script will fall back to WAV and warn you.
+# Output is deterministic: rerunning unchanged code only re-zips the existing
+# files (delete .sfx_cache to force a full rebuild).
 
+import functools
+import hashlib
+import json
 import os
 import io
 import zipfile
 import shutil
-import math
-import random
+import subprocess
 import warnings
-from typing import Callable
+import wave
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
 
 import numpy as np
-from pydub import AudioSegment, effects
+
+import audio_filters
+from audio_filters import (
+    comb_inplace,
+    one_pole_hp as _apply_highpass,
+    one_pole_lp as _apply_lowpass,
+    reverb_taps_inplace,
+)
 
 
 # ----------------------------
@@ -23,9 +41,15 @@ from pydub import AudioSegment, effects
 # ----------------------------
 SAMPLE_RATE = 44100
 BIT_DEPTH = 16  # 16-bit PCM
+DTYPE = np.float32  # synthesis dtype; output is int16 PCM, so float64 buys nothing
 CHANNELS = 2  # stereo
 TARGET_DIR = os.path.join(".", "public", "assets", "sfx")
 BITRATE = "320k"  # epic quality
+RNG_SEED = 0xC0FFEE
+# PCG64 generator for all randomness; reseeded per SFX in _seed_rng
+_RNG = np.random.default_rng(RNG_SEED)
+CACHE_MANIFEST = os.path.join(".", ".sfx_cache")
+NORMALIZE_PEAK = 10 ** (-0.1 / 20)  # -0.1 dBFS (pydub effects.normalize headroom)
 DURATION_S = {
     "gale": 0.9,
     "ember": 0.9,
@@ -55,6 +79,21 @@ def _normalize_peak(x: np.ndarray, peak: float = 0.9) -> np.ndarray:
     return (x / max_abs) * peak
 
 
+@functools.lru_cache(maxsize=64)
+def _ramp_up(n: int) -> np.ndarray:
+    # Fade ramps, shaped (n, 1) to broadcast over stereo; read-only because cached
+    env = np.linspace(0.0, 1.0, n, dtype=DTYPE).reshape(n, 1)
+    env.flags.writeable = False
+    return env
+
+
+@functools.lru_cache(maxsize=64)
+def _ramp_down(n: int) -> np.ndarray:
+    env = np.linspace(1.0, 0.0, n, dtype=DTYPE).reshape(n, 1)
+    env.flags.writeable = False
+    return env
+
+
 def _fade(
     x: np.ndarray, sr: int, fade_in_s: float = 0.02, fade_out_s: float = 0.05
 ) -> np.ndarray:
@@ -62,46 +101,21 @@ def _fade(
     fi = int(sr * fade_in_s)
     fo = int(sr * fade_out_s)
     if fi > 0:
-        fade_in = np.linspace(0.0, 1.0, fi)
-        x[:fi] *= fade_in[:, None] if x.ndim == 2 else fade_in
+        fade_in = _ramp_up(fi)
+        x[:fi] *= fade_in if x.ndim == 2 else fade_in[:, 0]
     if fo > 0:
-        fade_out = np.linspace(1.0, 0.0, fo)
-        x[-fo:] *= fade_out[:, None] if x.ndim == 2 else fade_out
+        fade_out = _ramp_down(fo)
+        x[-fo:] *= fade_out if x.ndim == 2 else fade_out[:, 0]
     return x
 
 
-def _apply_lowpass(x: np.ndarray, cutoff_hz: float, sr: int) -> np.ndarray:
-    # Simple 1-pole low-pass (real-time friendly; musical, not surgical)
-    rc = 1.0 / (2 * math.pi * cutoff_hz)
-    dt = 1.0 / sr
-    alpha = dt / (rc + dt)
-    y = np.zeros_like(x)
-    y[0] = x[0]
-    for i in range(1, len(x)):
-        y[i] = y[i - 1] + alpha * (x[i] - y[i - 1])
-    return y
-
-
-def _apply_highpass(x: np.ndarray, cutoff_hz: float, sr: int) -> np.ndarray:
-    # Simple 1-pole high-pass
-    rc = 1.0 / (2 * math.pi * cutoff_hz)
-    dt = 1.0 / sr
-    alpha = rc / (rc + dt)
-    y = np.zeros_like(x)
-    y[0] = x[0]
-    for i in range(1, len(x)):
-        y[i] = alpha * (y[i - 1] + x[i] - x[i - 1])
-    return y
-
-
 def _comb_filter(
     x: np.ndarray, delay_ms: float, feedback: float, sr: int
 ) -> np.ndarray:
     # Simple mono comb filter
     delay_samples = int(sr * delay_ms / 1000.0)
     y = np.copy(x)
-    for i in range(delay_samples, len(x)):
-        y[i] += feedback * y[i - delay_samples]
+    comb_inplace(y, delay_samples, feedback)
     return _normalize_peak(y, 0.9)
 
 
@@ -109,78 +123,131 @@ def _reverb_simple(
     stereo: np.ndarray, sr: int, decay=0.5, num_taps=4, base_delay_ms=60
 ) -> np.ndarray:
     # Very lightweight stereo reverb using a few delayed taps
-    y = np.copy(stereo)
-    for t in range(1, num_taps + 1):
-        delay = int(sr * (base_delay_ms * t) / 1000.0)
-        gain = decay**t
-        pad = np.zeros((delay, 2))
-        tail = np.vstack([pad, stereo[:-delay]]) if delay < len(stereo) else pad
+    delays = np.empty(num_taps, dtype=np.int64)
+    gains_l = np.empty(num_taps)
+    gains_r = np.empty(num_taps)
+    for k in range(num_taps):
+        t = k + 1
+        delays[k] = int(sr * (base_delay_ms * t) / 1000.0)
+        gains_l[k] = decay**t
         # Slight stereo variation
-        y[:, 0] += gain * tail[:, 0]
-        y[:, 1] += gain * tail[:, 1] * (0.9 + 0.2 * random.random())
+        gains_r[k] = gains_l[k] * (0.9 + 0.2 * _RNG.random())
+    y = np.copy(stereo)
+    reverb_taps_inplace(stereo, y, delays, gains_l, gains_r)
     return _normalize_peak(y, 0.95)
 
 
-def _np_to_audiosegment(stereo: np.ndarray, sr: int) -> AudioSegment:
-    # Expect stereo float32/-1..1
+def _to_pcm16(stereo: np.ndarray) -> bytes:
+    # Expect stereo float32/-1..1; interleaved 16-bit little-endian PCM
     stereo = np.clip(stereo, -1.0, 1.0)
-    int16 = np.int16(stereo * (2**15 - 1))
-    raw = int16.tobytes()
-    seg = AudioSegment(
-        data=raw,
-        sample_width=2,  # 16-bit
-        frame_rate=sr,
-        channels=2,
-    )
-    return seg
-
-
-def _export_audio(seg: AudioSegment, path_mp3: str, fallback_wav: bool = True):
+    return np.ascontiguousarray(stereo * (2**15 - 1)).astype(np.int16).tobytes()
+
+
+def _write_wav_int16(path: str, pcm: bytes, sr: int):
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(CHANNELS)
+        wf.setsampwidth(BIT_DEPTH // 8)
+        wf.setframerate(sr)
+        wf.writeframes(pcm)
+
+
+def _export_audio(
+    stereo: np.ndarray, sr: int, path_mp3: str, fallback_wav: bool = True
+) -> str:
+    # Pipe raw PCM into ffmpeg's stdin: no temp WAV on the MP3 path
+    pcm = _to_pcm16(stereo)
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "s16le",
+        "-ar",
+        str(sr),
+        "-ac",
+        str(CHANNELS),
+        "-i",
+        "-",
+        "-codec:a",
+        "libmp3lame",
+        "-b:a",
+        BITRATE,
+        path_mp3,
+    ]
     try:
-        seg.export(path_mp3, format="mp3", bitrate=BITRATE)
-    except Exception as e:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        proc.communicate(pcm)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        return path_mp3
+    except (OSError, subprocess.CalledProcessError) as e:
         if fallback_wav:
             warnings.warn(
                 f"Failed to export MP3 (ffmpeg missing?). Exporting WAV instead. Error: {e}"
             )
             wav_path = os.path.splitext(path_mp3)[0] + ".wav"
-            seg.export(wav_path, format="wav")
-        else:
-            raise
+            _write_wav_int16(wav_path, pcm, sr)
+            return wav_path
+        raise
 
 
 # ----------------------------
 # Synth building blocks
 # ----------------------------
+@functools.lru_cache(maxsize=8)
+def _t_axis(duration: float, sr: int = SAMPLE_RATE) -> np.ndarray:
+    # Shared by every SFX of the same duration; read-only because it is cached
+    t = np.linspace(0, duration, int(sr * duration), endpoint=False, dtype=DTYPE)
+    t.flags.writeable = False
+    return t
+
+
 def _sine(f, t):
-    return np.sin(2 * np.pi * f * t)
+    # Reuse the phase buffer as the sin output: one temporary per call
+    phase = (2 * np.pi * f) * t
+    return np.sin(phase, out=phase)
 
 
 def _noise(n):
-    return np.random.uniform(-1.0, 1.0, size=n)
+    x = _RNG.random(n, dtype=DTYPE)  # float32 fill, no float64 round trip
+    x *= 2.0
+    x -= 1.0
+    return x
+
+
+@functools.lru_cache(maxsize=8)
+def _hann(n: int) -> np.ndarray:
+    # Loop-invariant window for crackles/clanks; read-only because it is cached
+    w = np.hanning(n).astype(DTYPE)
+    w.flags.writeable = False
+    return w
 
 
 def _envelope_ad(t, attack=0.02, decay=0.3, sr=SAMPLE_RATE):
     n = len(t)
-    env = np.ones(n)
+    env = np.ones(n, dtype=DTYPE)
     a = int(attack * sr)
     d = int(decay * sr)
     if a > 0:
-        env[:a] = np.linspace(0, 1, a)
+        env[:a] = np.linspace(0, 1, a, dtype=DTYPE)
     if d > 0:
-        decay_curve = np.linspace(1, 0.2, d)
+        decay_curve = np.linspace(1, 0.2, d, dtype=DTYPE)
         end = min(a + d, n)
         env[a:end] = decay_curve[: (end - a)]
     return env
 
 
+_BELL_PARTIALS = np.array([1.0, 2.01, 2.74, 3.76], dtype=DTYPE)
+_BELL_AMPS = np.array([1.0, 0.5, 0.3, 0.2], dtype=DTYPE)
+
+
 def _bell_tone(duration, base_f=660.0, sr=SAMPLE_RATE):
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-    partials = [1.0, 2.01, 2.74, 3.76]
-    amps = [1.0, 0.5, 0.3, 0.2]
-    x = np.zeros_like(t)
-    for p, a in zip(partials, amps):
-        x += a * _sine(base_f * p, t)
+    t = _t_axis(duration, sr)
+    # All partials in one (4, n) sin, then summed by a single amps @ GEMV
+    phase = np.outer(_BELL_PARTIALS * (2 * np.pi * base_f), t)
+    x = _BELL_AMPS @ np.sin(phase, out=phase)
     x *= _envelope_ad(t, attack=0.005, decay=duration * 0.9, sr=sr)
     return x
 
@@ -190,13 +257,13 @@ def _bell_tone(duration, base_f=660.0, sr=SAMPLE_RATE):
 # ----------------------------
 def sfx_gale(duration: float) -> np.ndarray:
     n = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, n, endpoint=False)
+    t = _t_axis(duration)
     # Wind: filtered noise + slight pitch movement + whoosh swell
     base = _noise(n)
-    base = _apply_lowpass(base, cutoff_hz=1200, sr=SAMPLE_RATE)
+    base = _apply_lowpass(base, cutoff_hz=1200, sr=SAMPLE_RATE, out=base)
     whoosh = 0.6 * _sine(0.7, t) + 0.4 * _sine(1.3, t)
     x = base * (0.4 + 0.6 * (whoosh * 0.5 + 0.5))
-    x = _apply_highpass(x, 80, SAMPLE_RATE)
+    x = _apply_highpass(x, 80, SAMPLE_RATE, out=x)
     x = _normalize_peak(x, 0.8)
     x = _fade(x, SAMPLE_RATE, 0.03, 0.12)
     # Subtle stereo spread
@@ -207,16 +274,19 @@ def sfx_gale(duration: float) -> np.ndarray:
 
 def sfx_ember(duration: float) -> np.ndarray:
     n = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, n, endpoint=False)
+    t = _t_axis(duration)
     # Fire: low rumble + crackles (random spikes) + airy fizz
     rumble = 0.3 * _sine(65, t) + 0.2 * _sine(130, t)
-    fizz = _apply_highpass(_noise(n) * 0.4, 3000, SAMPLE_RATE)
-    crackles = np.zeros(n)
-    for _ in range(18):
-        pos = random.randint(0, n - int(0.015 * SAMPLE_RATE) - 1)
-        length = int(0.015 * SAMPLE_RATE)
-        spike = np.hanning(length) * (0.9 + 0.3 * random.random())
-        crackles[pos : pos + length] += spike
+    fizz = _noise(n) * 0.4
+    fizz = _apply_highpass(fizz, 3000, SAMPLE_RATE, out=fizz)
+    crackles = np.zeros(n, dtype=DTYPE)
+    length = int(0.015 * SAMPLE_RATE)
+    positions = _RNG.integers(0, n - length, size=18)
+    amps = 0.9 + 0.3 * _RNG.random(18, dtype=DTYPE)
+    # Scatter all 18 spikes at once; overlapping spikes still accumulate
+    idx = positions[:, None] + np.arange(length)[None, :]
+    spikes = np.outer(amps, _hann(length))
+    np.add.at(crackles, idx.ravel(), spikes.ravel())
     x = rumble + 0.5 * crackles + 0.25 * fizz
     x = _normalize_peak(x, 0.95)
     x = _fade(x, SAMPLE_RATE, 0.005, 0.1)
@@ -225,8 +295,6 @@ def sfx_ember(duration: float) -> np.ndarray:
 
 
 def sfx_ward(duration: float) -> np.ndarray:
-    n = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, n, endpoint=False)
     # Metallic shield pulse: bell-like hit + comb filter resonance
     hit = _bell_tone(duration, base_f=520.0)
     metal = _comb_filter(hit, delay_ms=14.5, feedback=0.4, sr=SAMPLE_RATE)
@@ -239,12 +307,11 @@ def sfx_ward(duration: float) -> np.ndarray:
 
 def sfx_snare(duration: float) -> np.ndarray:
     n = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, n, endpoint=False)
     # Trap snap: short metallic clank + springy tail
-    clank = np.zeros(n)
+    clank = np.zeros(n, dtype=DTYPE)
     burst_len = int(0.04 * SAMPLE_RATE)
-    clank[:burst_len] = np.hanning(burst_len) * 1.0
-    clank = _apply_highpass(clank, 1200, SAMPLE_RATE)
+    clank[:burst_len] = _hann(burst_len)
+    clank = _apply_highpass(clank, 1200, SAMPLE_RATE, out=clank)
     tail = _comb_filter(clank * 0.6, delay_ms=11, feedback=0.5, sr=SAMPLE_RATE)
     x = clank * 0.8 + tail * 0.6
     x = _normalize_peak(x, 0.95)
@@ -256,7 +323,8 @@ def sfx_snare(duration: float) -> np.ndarray:
 def sfx_soothe(duration: float) -> np.ndarray:
     # Healing chime: soft bell + airy shimmer
     bell = _bell_tone(duration, base_f=740.0)
-    shimmer = _apply_highpass(_noise(len(bell)) * 0.2, 6000, SAMPLE_RATE)
+    shimmer = _noise(len(bell)) * 0.2
+    shimmer = _apply_highpass(shimmer, 6000, SAMPLE_RATE, out=shimmer)
     x = 0.85 * bell + 0.2 * shimmer
     x = _normalize_peak(x, 0.9)
     x = _fade(x, SAMPLE_RATE, 0.01, 0.35)
@@ -266,11 +334,12 @@ def sfx_soothe(duration: float) -> np.ndarray:
 
 def sfx_void(duration: float) -> np.ndarray:
     n = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, n, endpoint=False)
+    t = _t_axis(duration)
     # Void: sub + reverse-like swell + airy dark texture
     sub = 0.7 * _sine(40, t) + 0.4 * _sine(80, t)
-    texture = _apply_lowpass(_noise(n) * 0.3, 1200, SAMPLE_RATE)
-    swell = np.clip(np.linspace(0.0, 1.0, n) ** 2.2, 0, 1)
+    texture = _noise(n) * 0.3
+    texture = _apply_lowpass(texture, 1200, SAMPLE_RATE, out=texture)
+    swell = np.clip(np.linspace(0.0, 1.0, n, dtype=DTYPE) ** 2.2, 0, 1)
     x = sub * (0.6 + 0.4 * swell) + 0.3 * texture * (1.0 - swell * 0.5)
     x = _normalize_peak(x, 0.9)
     x = _fade(x, SAMPLE_RATE, 0.03, 0.2)
@@ -280,11 +349,12 @@ def sfx_void(duration: float) -> np.ndarray:
 
 def sfx_aegis(duration: float) -> np.ndarray:
     n = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, n, endpoint=False)
+    t = _t_axis(duration)
     # Aegis: bright protective flare (riser + bell + sparkle)
-    riser = _sine(320, t) * np.linspace(0.2, 1.0, n)
+    riser = _sine(320, t) * np.linspace(0.2, 1.0, n, dtype=DTYPE)
     bell = _bell_tone(duration, base_f=880.0)
-    sparkle = _apply_highpass(_noise(n) * 0.2, 7000, SAMPLE_RATE)
+    sparkle = _noise(n) * 0.2
+    sparkle = _apply_highpass(sparkle, 7000, SAMPLE_RATE, out=sparkle)
     x = 0.6 * riser + 0.7 * bell + 0.18 * sparkle
     x = _normalize_peak(x, 0.92)
     x = _fade(x, SAMPLE_RATE, 0.005, 0.35)
@@ -307,27 +377,97 @@ GENERATORS: dict[str, Callable[[float], np.ndarray]] = {
 # ----------------------------
 # Main build
 # ----------------------------
-def main():
-    _ensure_dirs()
+def _seed_rng(name: str):
+    # Seed per SFX, not per run: output must not depend on which worker renders it
+    global _RNG
+    _RNG = np.random.default_rng([RNG_SEED, zlib.crc32(name.encode())])
+
+
+def _render_one(name: str) -> str:
+    _seed_rng(name)
+    dur = DURATION_S.get(name, 0.9)
+    stereo = GENERATORS[name](dur)  # float32 stereo -1..1
+
+    # Musical normalization (peak to -0.1 dBFS), done on the float buffer
+    stereo = _normalize_peak(stereo, NORMALIZE_PEAK)
+
+    out_path_mp3 = os.path.join(TARGET_DIR, f"{name}.mp3")
+    return _export_audio(stereo, SAMPLE_RATE, out_path_mp3, fallback_wav=True)
 
-    generated_files = []
 
-    for name, gen in GENERATORS.items():
-        dur = DURATION_S.get(name, 0.9)
-        stereo = gen(dur)  # float32 stereo -1..1
+def _cache_key() -> str:
+    # Seeded output only changes with the code (or with ffmpeg: MP3 vs WAV fallback)
+    digest = hashlib.sha1()
+    for src in (__file__, audio_filters.__file__):
+        with open(src, "rb") as f:
+            digest.update(f.read())
+    # AOT, JIT, lfilter and pure-Python kernels round differently
+    digest.update(audio_filters.kernel_backend().encode())
+    version = digest.hexdigest()[:8]
+    return f"{version}-{'mp3' if shutil.which('ffmpeg') else 'wav'}"
 
-        # Hard limiter + small gain normalization via pydub
-        seg = _np_to_audiosegment(stereo, SAMPLE_RATE)
-        seg = effects.normalize(seg)  # musical normalization
 
-        out_path_mp3 = os.path.join(TARGET_DIR, f"{name}.mp3")
-        _export_audio(seg, out_path_mp3, fallback_wav=True)
+def _outputs_match_key(key: str, files: list[str]) -> bool:
+    # A failed MP3 encode falls back to WAV even with ffmpeg on PATH: not cacheable
+    ext = "." + key.rsplit("-", 1)[1]
+    return all(f.endswith(ext) for f in files)
 
-        if os.path.exists(out_path_mp3):
-            generated_files.append(out_path_mp3)
-        else:
-            wav_fallback = os.path.splitext(out_path_mp3)[0] + ".wav"
-            generated_files.append(wav_fallback)
+
+def _cached_outputs(key: str) -> Optional[list[str]]:
+    try:
+        with open(CACHE_MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    files = manifest.get("files") or []
+    # v1 and v2 write the same files: only trust a manifest this script wrote
+    if manifest.get("script") != os.path.basename(__file__):
+        return None
+    if manifest.get("key") != key or not files:
+        return None
+    if not _outputs_match_key(key, files):
+        return None
+    if not all(os.path.exists(f) for f in files):
+        return None
+    return files
+
+
+def _write_manifest(key: str, files: list[str]):
+    manifest = {"script": os.path.basename(__file__), "key": key, "files": files}
+    with open(CACHE_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def _clear_manifest():
+    # Called before overwriting the outputs, so a failed or partial build
+    # never leaves a manifest vouching for files it no longer describes
+    try:
+        os.remove(CACHE_MANIFEST)
+    except FileNotFoundError:
+        pass
+
+
+def main():
+    _ensure_dirs()
+
+    cache_key = _cache_key()
+    generated_files = _cached_outputs(cache_key)
+    if generated_files is None:
+        _clear_manifest()
+        # SFX are fully independent: render + export each one in its own process;
+        # leftover cores go to the parallel reverb kernel inside each worker
+        cpus = os.cpu_count() or 1
+        workers = min(len(GENERATORS), cpus)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=audio_filters.set_kernel_threads,
+            initargs=(cpus // workers,),
+        ) as ex:
+            generated_files = list(ex.map(_render_one, GENERATORS))
+        if _outputs_match_key(cache_key, generated_files):
+            _write_manifest(cache_key, generated_files)
+    else:
+        print("\n♻️ Script unchanged since the last run: reusing the existing SFX.")
 
     # Zip them
     zip_name = "sfx_witcher.zip"
@@ -335,7 +475,11 @@ def main():
         for f in generated_files:
             # Store inside zip preserving public/assets/sfx/ structure
             arcname = os.path.relpath(f, ".")
-            zf.write(f, arcname)
+            # MP3 is already entropy-coded; only the WAV fallbacks gain from DEFLATE
+            compress = (
+                zipfile.ZIP_STORED if f.endswith(".mp3") else zipfile.ZIP_DEFLATED
+            )
+            zf.write(f, arcname, compress_type=compress)
 
     # Console summary
     print("\n✅ SFX generated:")
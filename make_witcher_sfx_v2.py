@@ -1,28 +1,49 @@
 # make_witcher_sfx_v2.py
-# Genera SFX estilo Witcher. Escribe WAVs con la stdlib (sin ffmpeg),
-# luego convierte a MP3 320kbps con ffmpeg CLI (si está disponible).
+# Genera SFX estilo Witcher. Convierte a MP3 320kbps con ffmpeg CLI (el PCM va por
+# stdin, sin WAV intermedio); si no hay ffmpeg escribe WAVs con la stdlib.
 # Salida: ./public/assets/sfx/*.mp3 (o .wav si no hay ffmpeg) y sfx_witcher.zip
-
+# La salida es determinista: si el script no cambió solo se rehace el zip
+# (borra .sfx_cache para forzar una regeneración completa).
+# Opcional: pip install numba (compila con JIT los bucles por muestra de los filtros),
+# o pip install scipy (usa lfilter para los filtros de 1 polo si no hay numba).
+# Los kernels de filtros/reverb están en audio_filters.py (junto a este script).
+# Con numba, `python compile_kernels.py` los precompila una vez (sin warmup del JIT).
+
+import functools
+import hashlib
+import json
 import os
 import io
 import zipfile
-import math
-import random
 import subprocess
 import shutil
 import wave
-from typing import Callable
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
 
 import numpy as np
 
+import audio_filters
+from audio_filters import (
+    comb_inplace,
+    one_pole_hp as highpass,
+    one_pole_lp as lowpass,
+    reverb_taps_inplace,
+)
+
 # ----------------------------
 # Config
 # ----------------------------
 SAMPLE_RATE = 44100
 CHANNELS = 2  # stereo
+DTYPE = np.float32  # la salida es PCM int16: float64 no aporta nada
 TARGET_DIR = os.path.join(".", "public", "assets", "sfx")
-TMP_WAV_DIR = os.path.join(".", ".tmp_wav_sfx")
 BITRATE = "320k"
+RNG_SEED = 0xC0FFEE
+# Generador PCG64 para todo lo aleatorio; se re-siembra por SFX en seed_rng
+RNG = np.random.default_rng(RNG_SEED)
+CACHE_MANIFEST = os.path.join(".", ".sfx_cache")
 DURATION_S = {
     "gale": 0.9,
     "ember": 0.9,
@@ -39,7 +60,6 @@ DURATION_S = {
 # ----------------------------
 def ensure_dirs():
     os.makedirs(TARGET_DIR, exist_ok=True)
-    os.makedirs(TMP_WAV_DIR, exist_ok=True)
 
 
 def has_ffmpeg() -> bool:
@@ -52,82 +72,97 @@ def normalize_peak(x: np.ndarray, peak: float = 0.95) -> np.ndarray:
     return (x / m) * peak
 
 
+@functools.lru_cache(maxsize=64)
+def ramp_up(n: int) -> np.ndarray:
+    # Rampas de fade con forma (n, 1) para el estéreo; solo lectura porque se cachean
+    env = np.linspace(0.0, 1.0, n, dtype=DTYPE).reshape(n, 1)
+    env.flags.writeable = False
+    return env
+
+
+@functools.lru_cache(maxsize=64)
+def ramp_down(n: int) -> np.ndarray:
+    env = np.linspace(1.0, 0.0, n, dtype=DTYPE).reshape(n, 1)
+    env.flags.writeable = False
+    return env
+
+
 def fade(x: np.ndarray, sr: int, fi: float = 0.02, fo: float = 0.05) -> np.ndarray:
     n = x.shape[0]
     fi_n = int(sr * fi)
     fo_n = int(sr * fo)
     if fi_n > 0:
-        env_in = np.linspace(0.0, 1.0, fi_n)
-        x[:fi_n] *= env_in[:, None]
+        x[:fi_n] *= ramp_up(fi_n)
     if fo_n > 0:
-        env_out = np.linspace(1.0, 0.0, fo_n)
-        x[-fo_n:] *= env_out[:, None]
+        x[-fo_n:] *= ramp_down(fo_n)
     return x
 
 
-def lowpass(x: np.ndarray, cutoff_hz: float, sr: int) -> np.ndarray:
-    rc = 1.0 / (2 * math.pi * cutoff_hz)
-    dt = 1.0 / sr
-    alpha = dt / (rc + dt)
-    y = np.zeros_like(x)
-    y[0] = x[0]
-    for i in range(1, len(x)):
-        y[i] = y[i - 1] + alpha * (x[i] - y[i - 1])
-    return y
-
-
-def highpass(x: np.ndarray, cutoff_hz: float, sr: int) -> np.ndarray:
-    rc = 1.0 / (2 * math.pi * cutoff_hz)
-    dt = 1.0 / sr
-    alpha = rc / (rc + dt)
-    y = np.zeros_like(x)
-    y[0] = x[0]
-    for i in range(1, len(x)):
-        y[i] = alpha * (y[i - 1] + x[i] - x[i - 1])
-    return y
-
-
 def comb_filter(x: np.ndarray, delay_ms: float, feedback: float, sr: int) -> np.ndarray:
     d = int(sr * delay_ms / 1000.0)
     y = np.copy(x)
-    for i in range(d, len(x)):
-        y[i] += feedback * y[i - d]
+    comb_inplace(y, d, feedback)
     return normalize_peak(y, 0.9)
 
 
 def reverb_simple(st: np.ndarray, sr: int, decay=0.5, taps=4, base_ms=60) -> np.ndarray:
+    delays = np.empty(taps, dtype=np.int64)
+    g_l = np.empty(taps)
+    g_r = np.empty(taps)
+    for k in range(taps):
+        t = k + 1
+        delays[k] = int(sr * (base_ms * t) / 1000.0)
+        g_l[k] = decay**t
+        g_r[k] = g_l[k] * (0.9 + 0.2 * RNG.random())
     y = np.copy(st)
-    for t in range(1, taps + 1):
-        delay = int(sr * (base_ms * t) / 1000.0)
-        gain = decay**t
-        pad = np.zeros((delay, 2))
-        tail = np.vstack([pad, st[:-delay]]) if delay < len(st) else pad
-        y[:, 0] += gain * tail[:, 0]
-        y[:, 1] += gain * tail[:, 1] * (0.9 + 0.2 * random.random())
+    reverb_taps_inplace(st, y, delays, g_l, g_r)
     return normalize_peak(y, 0.95)
 
 
+@functools.lru_cache(maxsize=8)
+def t_axis(duration: float, sr: int = SAMPLE_RATE) -> np.ndarray:
+    # Compartido por los SFX de igual duración; solo lectura porque está cacheado
+    t = np.linspace(0, duration, int(sr * duration), endpoint=False, dtype=DTYPE)
+    t.flags.writeable = False
+    return t
+
+
 def sine(f, t):
-    return np.sin(2 * np.pi * f * t)
+    # El buffer de fase se reutiliza como salida de sin: un solo temporal
+    phase = (2 * np.pi * f) * t
+    return np.sin(phase, out=phase)
 
 
 def noise(n):
-    return np.random.uniform(-1.0, 1.0, size=n)
+    x = RNG.random(n, dtype=DTYPE)  # se llena en float32, sin pasar por float64
+    x *= 2.0
+    x -= 1.0
+    return x
+
+
+@functools.lru_cache(maxsize=8)
+def hann(n: int) -> np.ndarray:
+    # Ventana invariante para crackles/clanks; solo lectura porque está cacheada
+    w = np.hanning(n).astype(DTYPE)
+    w.flags.writeable = False
+    return w
+
+
+BELL_PARTIALS = np.array([1.0, 2.01, 2.74, 3.76], dtype=DTYPE)
+BELL_AMPS = np.array([1.0, 0.5, 0.3, 0.2], dtype=DTYPE)
 
 
 def bell_tone(duration, base_f=660.0, sr=SAMPLE_RATE):
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-    partials = [1.0, 2.01, 2.74, 3.76]
-    amps = [1.0, 0.5, 0.3, 0.2]
-    x = np.zeros_like(t)
-    for p, a in zip(partials, amps):
-        x += a * sine(base_f * p, t)
+    t = t_axis(duration, sr)
+    # Todos los parciales en un solo sin (4, n) y una sola suma amps @ (GEMV)
+    phase = np.outer(BELL_PARTIALS * (2 * np.pi * base_f), t)
+    x = BELL_AMPS @ np.sin(phase, out=phase)
     # Envelope
     a = int(0.005 * sr)
     d = int(duration * 0.9 * sr)
     env = np.ones_like(t)
-    env[:a] = np.linspace(0, 1, a)
-    env[a : a + d] = np.linspace(1, 0.25, min(d, len(t) - a))
+    env[:a] = np.linspace(0, 1, a, dtype=DTYPE)
+    env[a : a + d] = np.linspace(1, 0.25, min(d, len(t) - a), dtype=DTYPE)
     return x * env
 
 
@@ -137,39 +172,80 @@ def to_stereo(x: np.ndarray) -> np.ndarray:
     return x
 
 
-def write_wav_int16(path: str, stereo: np.ndarray, sr: int):
-    # stereo float32 [-1,1] -> int16 PCM WAV
-    stereo = np.clip(stereo, -1.0, 1.0)
-    int16 = (stereo * (2**15 - 1)).astype(np.int16)
+# Buffer int16 reutilizable (uno por proceso) para pasar de float a PCM
+INT16_SCRATCH = np.empty((int(1.5 * SAMPLE_RATE), CHANNELS), dtype=np.int16)
+
+
+def to_pcm16(stereo: np.ndarray) -> bytes:
+    # stereo float32 [-1,1] -> PCM int16 intercalado. Recorta y escala in-place
+    # (stereo queda modificado) y castea al buffer reutilizable: sin temporales.
+    np.clip(stereo, -1.0, 1.0, out=stereo)
+    stereo *= 2**15 - 1
+    n = stereo.shape[0]
+    if n <= INT16_SCRATCH.shape[0]:
+        out = INT16_SCRATCH[:n]
+    else:
+        out = np.empty((n, CHANNELS), dtype=np.int16)
+    np.copyto(out, stereo, casting="unsafe")
+    return out.tobytes()
+
+
+def write_wav_int16(path: str, pcm: bytes, sr: int):
     with wave.open(path, "wb") as wf:
         wf.setnchannels(2)
         wf.setsampwidth(2)  # 16-bit
         wf.setframerate(sr)
-        wf.writeframes(int16.tobytes())
+        wf.writeframesraw(pcm)
 
 
-def convert_wav_to_mp3(wav_path: str, mp3_path: str, bitrate="320k") -> bool:
-    if not has_ffmpeg():
-        return False
-    cmd = [
+def mp3_cmd(mp3_path: str, sr: int, bitrate="320k") -> list[str]:
+    return [
         "ffmpeg",
         "-y",
         "-hide_banner",
         "-loglevel",
         "error",
+        "-f",
+        "s16le",
+        "-ar",
+        str(sr),
+        "-ac",
+        str(CHANNELS),
         "-i",
-        wav_path,
+        "-",
         "-codec:a",
         "libmp3lame",
         "-b:a",
         bitrate,
         mp3_path,
     ]
-    try:
-        subprocess.check_call(cmd)
-        return os.path.exists(mp3_path) and os.path.getsize(mp3_path) > 1000
-    except subprocess.CalledProcessError:
-        return False
+
+
+def encode_pcm_to_mp3(
+    jobs: list[tuple[bytes, str]], sr: int, bitrate="320k"
+) -> list[bool]:
+    # jobs: [(pcm, mp3_path)]. Lanza todos los ffmpeg a la vez y alimenta cada uno
+    # desde su propio hilo (el PCM no cabe en el buffer del pipe: un write
+    # bloqueante los serializaría), así el tiempo total ≈ el encode más lento.
+    if not jobs or not has_ffmpeg():
+        return [False] * len(jobs)
+    procs = [
+        subprocess.Popen(
+            mp3_cmd(mp3, sr, bitrate),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+        )
+        for _, mp3 in jobs
+    ]
+    # communicate() escribe, cierra stdin (tolerando EPIPE) y espera al proceso
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        list(ex.map(lambda jp: jp[1].communicate(jp[0][0]), zip(jobs, procs)))
+    return [
+        p.returncode == 0
+        and os.path.exists(mp3_path)
+        and os.path.getsize(mp3_path) > 1000
+        for (_, mp3_path), p in zip(jobs, procs)
+    ]
 
 
 # ----------------------------
@@ -177,12 +253,12 @@ def convert_wav_to_mp3(wav_path: str, mp3_path: str, bitrate="320k") -> bool:
 # ----------------------------
 def sfx_gale(d: float) -> np.ndarray:
     n = int(SAMPLE_RATE * d)
-    t = np.linspace(0, d, n, endpoint=False)
+    t = t_axis(d)
     base = noise(n)
-    base = lowpass(base, 1200, SAMPLE_RATE)
+    base = lowpass(base, 1200, SAMPLE_RATE, out=base)
     whoosh = 0.6 * sine(0.7, t) + 0.4 * sine(1.3, t)
     x = base * (0.4 + 0.6 * (whoosh * 0.5 + 0.5))
-    x = highpass(x, 80, SAMPLE_RATE)
+    x = highpass(x, 80, SAMPLE_RATE, out=x)
     x = normalize_peak(x, 0.8)
     L = x
     R = lowpass(x, 900, SAMPLE_RATE)
@@ -192,15 +268,17 @@ def sfx_gale(d: float) -> np.ndarray:
 
 def sfx_ember(d: float) -> np.ndarray:
     n = int(SAMPLE_RATE * d)
-    t = np.linspace(0, d, n, endpoint=False)
+    t = t_axis(d)
     rumble = 0.3 * sine(65, t) + 0.2 * sine(130, t)
-    fizz = highpass(noise(n) * 0.4, 3000, SAMPLE_RATE)
-    crackles = np.zeros(n)
-    for _ in range(18):
-        pos = random.randint(0, n - int(0.015 * SAMPLE_RATE) - 1)
-        L = int(0.015 * SAMPLE_RATE)
-        spike = np.hanning(L) * (0.9 + 0.3 * random.random())
-        crackles[pos : pos + L] += spike
+    fizz = noise(n) * 0.4
+    fizz = highpass(fizz, 3000, SAMPLE_RATE, out=fizz)
+    crackles = np.zeros(n, dtype=DTYPE)
+    L = int(0.015 * SAMPLE_RATE)
+    pos = RNG.integers(0, n - L, size=18)
+    amps = 0.9 + 0.3 * RNG.random(18, dtype=DTYPE)
+    idx = pos[:, None] + np.arange(L)[None, :]
+    spikes = np.outer(amps, hann(L))
+    np.add.at(crackles, idx.ravel(), spikes.ravel())
     x = rumble + 0.5 * crackles + 0.25 * fizz
     x = normalize_peak(x, 0.95)
     st = np.stack([x, lowpass(x, 2500, SAMPLE_RATE)], axis=1)
@@ -220,10 +298,10 @@ def sfx_ward(d: float) -> np.ndarray:
 
 def sfx_snare(d: float) -> np.ndarray:
     n = int(SAMPLE_RATE * d)
-    clank = np.zeros(n)
+    clank = np.zeros(n, dtype=DTYPE)
     L = int(0.04 * SAMPLE_RATE)
-    clank[:L] = np.hanning(L) * 1.0
-    clank = highpass(clank, 1200, SAMPLE_RATE)
+    clank[:L] = hann(L)
+    clank = highpass(clank, 1200, SAMPLE_RATE, out=clank)
     tail = comb_filter(clank * 0.6, delay_ms=11, feedback=0.5, sr=SAMPLE_RATE)
     x = normalize_peak(clank * 0.8 + tail * 0.6, 0.95)
     st = np.stack([x, lowpass(x, 3500, SAMPLE_RATE)], axis=1)
@@ -233,7 +311,8 @@ def sfx_snare(d: float) -> np.ndarray:
 
 def sfx_soothe(d: float) -> np.ndarray:
     bell = bell_tone(d, base_f=740.0)
-    shimmer = highpass(noise(len(bell)) * 0.2, 6000, SAMPLE_RATE)
+    shimmer = noise(len(bell)) * 0.2
+    shimmer = highpass(shimmer, 6000, SAMPLE_RATE, out=shimmer)
     x = normalize_peak(0.85 * bell + 0.2 * shimmer, 0.9)
     st = np.stack([x, x * 0.95], axis=1)
     st = reverb_simple(st, SAMPLE_RATE, decay=0.65, taps=4, base_ms=55)
@@ -242,10 +321,11 @@ def sfx_soothe(d: float) -> np.ndarray:
 
 def sfx_void(d: float) -> np.ndarray:
     n = int(SAMPLE_RATE * d)
-    t = np.linspace(0, d, n, endpoint=False)
+    t = t_axis(d)
     sub = 0.7 * sine(40, t) + 0.4 * sine(80, t)
-    texture = lowpass(noise(n) * 0.3, 1200, SAMPLE_RATE)
-    swell = np.clip(np.linspace(0.0, 1.0, n) ** 2.2, 0, 1)
+    texture = noise(n) * 0.3
+    texture = lowpass(texture, 1200, SAMPLE_RATE, out=texture)
+    swell = np.clip(np.linspace(0.0, 1.0, n, dtype=DTYPE) ** 2.2, 0, 1)
     x = sub * (0.6 + 0.4 * swell) + 0.3 * texture * (1.0 - swell * 0.5)
     x = normalize_peak(x, 0.9)
     st = np.stack([x * 0.95, x], axis=1)
@@ -255,10 +335,11 @@ def sfx_void(d: float) -> np.ndarray:
 
 def sfx_aegis(d: float) -> np.ndarray:
     n = int(SAMPLE_RATE * d)
-    t = np.linspace(0, d, n, endpoint=False)
-    riser = sine(320, t) * np.linspace(0.2, 1.0, n)
+    t = t_axis(d)
+    riser = sine(320, t) * np.linspace(0.2, 1.0, n, dtype=DTYPE)
     bell = bell_tone(d, base_f=880.0)
-    sparkle = highpass(noise(n) * 0.2, 7000, SAMPLE_RATE)
+    sparkle = noise(n) * 0.2
+    sparkle = highpass(sparkle, 7000, SAMPLE_RATE, out=sparkle)
     x = normalize_peak(0.6 * riser + 0.7 * bell + 0.18 * sparkle, 0.92)
     st = np.stack([x, x], axis=1)
     st = reverb_simple(st, SAMPLE_RATE, decay=0.6, taps=5, base_ms=35)
@@ -279,43 +360,124 @@ GENERATORS: dict[str, Callable[[float], np.ndarray]] = {
 # ----------------------------
 # Build
 # ----------------------------
-def main():
-    ensure_dirs()
-    mp3_or_wav_paths = []
+def seed_rng(name: str):
+    # Semilla por SFX (no por corrida): no depende de qué proceso lo genere
+    global RNG
+    RNG = np.random.default_rng([RNG_SEED, zlib.crc32(name.encode())])
+
+
+def render_pcm(name: str) -> bytes:
+    seed_rng(name)
+    dur = DURATION_S.get(name, 0.9)
+    stereo = GENERATORS[name](dur)  # float32 stereo [-1,1]
+    # Sanity: ensure shape [N,2]
+    if stereo.ndim == 1:
+        stereo = to_stereo(stereo)
+    return to_pcm16(stereo)
+
+
+def cache_key() -> str:
+    # Con semillas fijas la salida solo cambia si cambia el código (o si hay ffmpeg)
+    digest = hashlib.sha1()
+    for src in (__file__, audio_filters.__file__):
+        with open(src, "rb") as f:
+            digest.update(f.read())
+    # Los kernels AOT, JIT, lfilter y Python puro redondean distinto
+    digest.update(audio_filters.kernel_backend().encode())
+    version = digest.hexdigest()[:8]
+    return f"{version}-{'mp3' if has_ffmpeg() else 'wav'}"
+
+
+def outputs_match_key(key: str, paths: list[str]) -> bool:
+    # Si ffmpeg está pero el encode falla se cae a WAV: eso no se cachea
+    ext = "." + key.rsplit("-", 1)[1]
+    return all(p.endswith(ext) for p in paths)
+
+
+def cached_outputs(key: str) -> Optional[list[str]]:
+    try:
+        with open(CACHE_MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    paths = manifest.get("files") or []
+    # v1 y v2 escriben los mismos archivos: solo vale un manifest de este script
+    if manifest.get("script") != os.path.basename(__file__):
+        return None
+    if manifest.get("key") != key or not paths:
+        return None
+    if not outputs_match_key(key, paths):
+        return None
+    if not all(os.path.exists(p) for p in paths):
+        return None
+    return paths
+
+
+def write_manifest(key: str, paths: list[str]):
+    manifest = {"script": os.path.basename(__file__), "key": key, "files": paths}
+    with open(CACHE_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def clear_manifest():
+    # Se borra antes de sobrescribir las salidas: un build fallido o a medias
+    # no deja un manifest que avale archivos que ya no describe
+    try:
+        os.remove(CACHE_MANIFEST)
+    except FileNotFoundError:
+        pass
+
 
-    for name, gen in GENERATORS.items():
-        dur = DURATION_S.get(name, 0.9)
-        stereo = gen(dur)  # float32 stereo [-1,1]
-        # Sanity: ensure shape [N,2]
-        if stereo.ndim == 1:
-            stereo = to_stereo(stereo)
-        # Write WAV first (no ffmpeg)
-        wav_path = os.path.join(TMP_WAV_DIR, f"{name}.wav")
-        write_wav_int16(wav_path, stereo, SAMPLE_RATE)
+def build_outputs() -> list[str]:
+    # Cada SFX es independiente: se generan en paralelo, uno por proceso;
+    # los cores sobrantes los usa la reverb paralela dentro de cada proceso
+    cpus = os.cpu_count() or 1
+    workers = min(len(GENERATORS), cpus)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=audio_filters.set_kernel_threads,
+        initargs=(cpus // workers,),
+    ) as ex:
+        pcms = list(ex.map(render_pcm, GENERATORS))
 
-        # Try MP3 convert
-        target_mp3 = os.path.join(TARGET_DIR, f"{name}.mp3")
-        ok_mp3 = convert_wav_to_mp3(wav_path, target_mp3, BITRATE)
+    # Try MP3 convert (todos los encodes corren a la vez)
+    targets_mp3 = [os.path.join(TARGET_DIR, f"{name}.mp3") for name in GENERATORS]
+    oks = encode_pcm_to_mp3(list(zip(pcms, targets_mp3)), SAMPLE_RATE, BITRATE)
 
+    mp3_or_wav_paths = []
+    for name, pcm, target_mp3, ok_mp3 in zip(GENERATORS, pcms, targets_mp3, oks):
         if ok_mp3:
             mp3_or_wav_paths.append(target_mp3)
         else:
-            # fallback: copy wav to target
+            # fallback: write the WAV to target
             target_wav = os.path.join(TARGET_DIR, f"{name}.wav")
-            shutil.copyfile(wav_path, target_wav)
+            write_wav_int16(target_wav, pcm, SAMPLE_RATE)
             mp3_or_wav_paths.append(target_wav)
+    return mp3_or_wav_paths
+
+
+def main():
+    ensure_dirs()
+
+    key = cache_key()
+    mp3_or_wav_paths = cached_outputs(key)
+    if mp3_or_wav_paths is None:
+        clear_manifest()
+        mp3_or_wav_paths = build_outputs()
+        if outputs_match_key(key, mp3_or_wav_paths):
+            write_manifest(key, mp3_or_wav_paths)
+    else:
+        print("\n♻️ El script no cambió: reutilizo los SFX existentes.")
 
     # Zip preserving paths
     zip_name = "sfx_witcher.zip"
     with zipfile.ZipFile(zip_name, "w", compression=zipfile.ZIP_DEFLATED) as zf:
         for p in mp3_or_wav_paths:
-            zf.write(p, os.path.relpath(p, "."))
-
-    # Clean tmp
-    try:
-        shutil.rmtree(TMP_WAV_DIR, ignore_errors=True)
-    except Exception:
-        pass
+            # El MP3 ya está comprimido: se guarda tal cual; solo los WAV usan DEFLATE
+            compress = (
+                zipfile.ZIP_STORED if p.endswith(".mp3") else zipfile.ZIP_DEFLATED
+            )
+            zf.write(p, os.path.relpath(p, "."), compress_type=compress)
 
     # Summary
     print("\n✅ Archivos generados:")